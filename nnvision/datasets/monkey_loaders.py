@@ -1,18 +1,228 @@
 import warnings
+import functools
 import torch
 import torch.utils.data as utils
 import numpy as np
 import pickle
+import json
 #from retina.retina import warp_image
 from collections import namedtuple, Iterable
 import os
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from neuralpredictors.data.samplers import RepeatsBatchSampler
-from .utility import get_validation_split, ImageCache, get_cached_loader, get_fraction_of_training_images, get_crop_from_stimulus_location
+from .utility import get_validation_split, get_image_cache, get_cached_loader, get_fraction_of_training_images, get_crop_from_stimulus_location
 from nnfabrik.utility.nn_helpers import set_random_seed, get_dims_for_loader_dict
 from neuralpredictors.utils import get_module_output
 from nnfabrik.utility.dj_helpers import make_hash
-import scipy
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+
+
+_config_hash_cache = {}
+
+
+def _config_hash(dataset_config):
+    """
+    Memoizes make_hash on the repr of the whitelisted loader config, so repeated
+    loader invocations with an identical config (e.g. the variants of one dataset
+    in a sweep) skip the serialization and hashing work.
+    """
+    key = repr(sorted(dataset_config.items()))
+    if key not in _config_hash_cache:
+        _config_hash_cache[key] = make_hash(dataset_config)
+    return _config_hash_cache[key]
+
+
+def _data_info_exists(stats_path):
+    return os.path.exists(stats_path + '.json') or os.path.exists(stats_path)
+
+
+def _save_data_info(data_info, stats_path):
+    """
+    Persists data_info as inspectable json. Entries that are not json-serializable
+    (e.g. array-valued image statistics) fall back to the legacy pickle format.
+    Both formats are written to a temp file first and moved into place with
+    os.replace, so concurrent loader invocations never observe a partial file.
+    """
+    try:
+        serializable = {
+            data_key: dict(session_info,
+                           input_dimensions=[int(dim) for dim in session_info["input_dimensions"]],
+                           output_dimension=int(session_info["output_dimension"]),
+                           img_mean=float(session_info["img_mean"]),
+                           img_std=float(session_info["img_std"]))
+            for data_key, session_info in data_info.items()
+        }
+        with open(stats_path + '.json.tmp', "w") as f:
+            json.dump(serializable, f)
+        os.replace(stats_path + '.json.tmp', stats_path + '.json')
+    except (TypeError, ValueError):
+        with open(stats_path + '.tmp', "wb") as pkl:
+            pickle.dump(data_info, pkl, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(stats_path + '.tmp', stats_path)
+
+
+def _load_data_info(stats_path):
+    """
+    Loads data_info from the json stats file, falling back to the legacy pickle
+    format when only that one is present.
+    """
+    if os.path.exists(stats_path + '.json'):
+        with open(stats_path + '.json', "r") as f:
+            return json.load(f)
+    with open(stats_path, "rb") as pkl:
+        return pickle.load(pkl)
+
+
+def _zscore_eye_positions(horizontal, vertical):
+    """
+    Stacks horizontal and vertical eye positions into an (N, 2) array and z-scores
+    each column in place, avoiding the vstack/transpose temporaries and the
+    per-call overhead of scipy.stats.zscore.
+
+    Args:
+        horizontal: 1D array of horizontal eye positions
+        vertical: 1D array of vertical eye positions
+
+    Returns: z-scored (N, 2) float32 array of eye positions
+    """
+    eye_pos = np.empty((len(horizontal), 2), dtype=np.float32)
+    eye_pos[:, 0] = horizontal
+    eye_pos[:, 1] = vertical
+    eye_pos -= eye_pos.mean(axis=0)
+    eye_pos /= eye_pos.std(axis=0)
+    return eye_pos
+
+
+@functools.lru_cache(maxsize=64)
+def _load_session_pickle(path, mtime):
+    """
+    Loads a session pickle file, memoized on (path, mtime) so that repeated loader
+    invocations (i.e. in nnfabrik hyperparameter sweeps) skip the deserialization.
+
+    Args:
+        path: path to the pickle file
+        mtime: modification time of the file, invalidates the cache when the file changes
+
+    Returns: the unpickled session dictionary
+    """
+    with open(path, "rb") as pkl:
+        return pickle.load(pkl)
+
+
+def _merge_unit_blocks(responses, mua_responses):
+    """
+    Stacks spike-sorted and MUA responses along the unit dimension, writing both
+    blocks into one preallocated float32 buffer instead of letting np.concatenate
+    allocate per call.
+
+    Args:
+        responses: response array of the spike-sorted units
+        mua_responses: response array of the MUA units, matching trailing dimensions
+
+    Returns: merged response array with the units of both inputs
+    """
+    n_units = responses.shape[0]
+    merged = np.empty((n_units + mua_responses.shape[0],) + responses.shape[1:], dtype=np.float32)
+    merged[:n_units] = responses
+    merged[n_units:] = mua_responses
+    return merged
+
+
+def _partition_train_val(train_mask, val_mask, *arrays):
+    """
+    Splits arrays into their train and validation parts along the first axis
+    with one stable gather per array, instead of one boolean fancy-index copy
+    per mask and array. The stable order keeps the relative ordering of the
+    entries within each part, matching the boolean-mask semantics.
+
+    Args:
+        train_mask: boolean mask selecting the training entries
+        val_mask: boolean mask selecting the validation entries, disjoint from train_mask
+        *arrays: arrays to split, all indexed by the same first axis
+
+    Returns: list of (train_part, validation_part) tuples, one per input array
+    """
+    labels = np.where(train_mask, 0, np.where(val_mask, 1, 2))
+    order = np.argsort(labels, kind="stable")
+    n_train = int(np.count_nonzero(train_mask))
+    n_val = int(np.count_nonzero(val_mask))
+    order = order[:n_train + n_val]
+    return [(gathered[:n_train], gathered[n_train:])
+            for gathered in (np.take(array, order, axis=0) for array in arrays)]
+
+
+def _f32(array):
+    """
+    Converts an array to contiguous float32, skipping the copy when the input
+    already has that dtype and layout.
+    """
+    return np.ascontiguousarray(array, dtype=np.float32)
+
+
+def _to_images_first(responses):
+    """
+    Transposes a raw (units, time, images) response array to (images, units, time)
+    and forces a contiguous layout, so the downstream fancy-index gathers and
+    vstacks run on unit strides instead of through the strided transpose view.
+    np.moveaxis keeps the trailing (units, time) axes in their original order,
+    so the copy runs over rows that are still contiguous in the source and hits
+    numpy's vectorized copy path.
+    """
+    return np.ascontiguousarray(np.moveaxis(responses, 2, 0))
+
+
+def _reduce_time_bins(responses, time_bins_sum, avg=False):
+    """
+    Reduces the time dimension of a raw (units, time, images) response array by
+    summing (or averaging) over the given time bins, returning (images, units).
+
+    Reducing on the raw layout before the (2, 0, 1) transpose keeps the
+    reduction on unit strides and skips the strided 3D intermediate entirely.
+
+    Args:
+        responses: 3D array of responses, laid out as (units, time, images)
+        time_bins_sum: indices of the time bins to sum over
+        avg: Boolean - Sums or Averages the responses across bins.
+
+    Returns: 2D response array of shape (images, units)
+    """
+    bins = np.asarray(time_bins_sum)
+    if njit is not None and responses.ndim == 3:
+        # fuse gather, reduction and transpose into one parallel pass over float32
+        out = np.empty((responses.shape[2], responses.shape[0]), dtype=np.float32)
+        scale = np.float32(1.0 / bins.size if avg else 1.0)
+        _reduce_time_bins_numba(responses, bins, scale, out)
+        return out
+    if bins.size > 0 and bins[0] >= 0 and np.array_equal(bins, np.arange(bins[0], bins[-1] + 1)):
+        # contiguous non-negative bins: a plain slice keeps the reduction on
+        # unit strides (negative bins would make the stop index wrap around,
+        # so they take the einsum path below, which handles them like fancy
+        # indexing did)
+        reduced = responses[:, bins[0]:bins[-1] + 1, :].sum(axis=1).T
+        return reduced / bins.size if avg else reduced
+    # non-contiguous bins: fold gather, reduction and transpose into one einsum
+    mask = np.zeros(responses.shape[1], dtype=responses.dtype)
+    mask[bins] = 1.0 / bins.size if avg else 1.0
+    return np.einsum("utn,t->nu", responses, mask)
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _reduce_time_bins_numba(responses, bins, scale, out):
+        for n in prange(responses.shape[2]):
+            for u in range(responses.shape[0]):
+                acc = 0.0
+                for b in bins:
+                    acc += responses[u, b, n]
+                out[n, u] = acc * scale
+
 
 def monkey_static_loader(dataset,
                          neuronal_data_files,
@@ -36,7 +246,9 @@ def monkey_static_loader(dataset,
                          stimulus_location=None,
                          monitor_scaling_factor=4.57,
                          train_shuffle=True,
-                         validation_shuffle=True):
+                         validation_shuffle=True,
+                         num_workers=0,
+                         pin_memory=True):
     """
     Function that returns cached dataloaders for monkey ephys experiments.
 
@@ -79,7 +291,19 @@ def monkey_static_loader(dataset,
     Returns: nested dictionary of dataloaders
     """
 
-    dataset_config = locals()
+    # restrict the config hash input to the arguments that actually parameterize
+    # the cached statistics, instead of hashing every local (which can include
+    # large arrays when img_mean/img_std are passed in)
+    dataset_config = dict(dataset=dataset,
+                          neuronal_data_files=neuronal_data_files,
+                          subsample=subsample,
+                          crop=crop,
+                          scale=scale,
+                          time_bins_sum=time_bins_sum,
+                          avg=avg,
+                          image_frac=image_frac,
+                          stimulus_location=stimulus_location,
+                          monitor_scaling_factor=monitor_scaling_factor)
 
     # initialize dataloaders as empty dict
     dataloaders = {'train': {}, 'validation': {}, 'test': {}}
@@ -94,120 +318,166 @@ def monkey_static_loader(dataset,
         crop = get_crop_from_stimulus_location(stimulus_location, crop, monitor_scaling_factor=monitor_scaling_factor)
 
     if not isinstance(image_frac, Iterable):
-        image_frac = [image_frac for i in neuronal_data_files]
+        image_frac = [image_frac] * len(neuronal_data_files)
 
     # clean up image path because of legacy folder structure
     image_cache_path = image_cache_path.split('individual')[0]
 
     # Load image statistics if present
-    stats_filename = make_hash(dataset_config)
+    stats_filename = _config_hash(dataset_config)
     stats_path = os.path.join(image_cache_path, 'statistics/', stats_filename)
 
     # Get mean and std
-    if os.path.exists(stats_path):
-        with open(stats_path, "rb") as pkl:
-            data_info = pickle.load(pkl)
+    stats_future = None
+    if _data_info_exists(stats_path):
+        data_info = _load_data_info(stats_path)
         if return_data_info:
             return data_info
-        img_mean = list(data_info.values())[0]["img_mean"]
-        img_std = list(data_info.values())[0]["img_std"]
+        img_mean = next(iter(data_info.values()))["img_mean"]
+        img_std = next(iter(data_info.values()))["img_std"]
         
         # Initialize cache
-        cache = ImageCache(path=image_cache_path, subsample=subsample, crop=crop, scale=scale, img_mean= img_mean, img_std=img_std, transform=True, normalize=True)
+        cache = get_image_cache(path=image_cache_path, subsample=subsample, crop=crop, scale=scale, img_mean= img_mean, img_std=img_std, transform=True, normalize=True)
     else:
 
         if img_mean is not None:
-            cache = ImageCache(path=image_cache_path, subsample=subsample, crop=crop, scale=scale, img_mean=img_mean,
+            cache = get_image_cache(path=image_cache_path, subsample=subsample, crop=crop, scale=scale, img_mean=img_mean,
                                img_std=img_std, transform=True, normalize=True)
         else:
             # Initialize cache with no normalization
-            cache = ImageCache(path=image_cache_path, subsample=subsample, crop=crop, scale=scale, transform=True, normalize=False)
+            cache = get_image_cache(path=image_cache_path, subsample=subsample, crop=crop, scale=scale, transform=True, normalize=False)
 
-            # Compute mean and std of transformed images and zscore data (the cache wil be filled so first epoch will be fast)
-            cache.zscore_images(update_stats=True)
-            img_mean = cache.img_mean
-            img_std  = cache.img_std
+            if cache.img_mean is not None:
+                # a pooled cache from an earlier call already carries the statistics
+                img_mean = cache.img_mean
+                img_std = cache.img_std
+            else:
+                # Compute mean and std of transformed images and zscore data (the cache wil
+                # be filled so first epoch will be fast). The scan is disk bound and runs in
+                # a background thread, overlapping with the session pickle processing below;
+                # it is joined once the statistics are needed.
+                stats_worker = ThreadPoolExecutor(max_workers=1)
+                stats_future = stats_worker.submit(cache.zscore_images, update_stats=True)
     
     
     n_images = len(cache)
     data_info = {}
 
     # set up parameters for the different dataset types
-    if dataset == 'PlosCB19_V1':
+    # hoist the dataset-type checks out of the per-session loop
+    is_non_plos = dataset != 'PlosCB19_V1'
+    reduce_time_bins = is_non_plos and time_bins_sum is not None
+
+    if not is_non_plos:
         # for the "Amadeus V1" Dataset, recorded by Santiago Cadena, there was no specified test set.
         # instead, the last 20% of the dataset were classified as test set. To make sure that the test set
-        # of this dataset will always stay identical, the `train_test_split` value is hardcoded here.
-        train_test_split = 0.8
+        # of this dataset will always stay identical, the 0.8 train/test split is hardcoded here.
+        split_n = int(n_images * 0.8)
         image_id_offset = 1
     else:
-        train_test_split = 1
+        split_n = n_images
         image_id_offset = 0
 
-    all_train_ids, all_validation_ids = get_validation_split(n_images=n_images * train_test_split,
+    all_train_ids, all_validation_ids = get_validation_split(n_images=split_n,
                                                              train_frac=train_frac,
                                                              seed=seed)
-    
-    # cycling through all datafiles to fill the dataloaders with an entry per session
-    for i, datapath in enumerate(neuronal_data_files):
-
-        with open(datapath, "rb") as pkl:
-            raw_data = pickle.load(pkl)
-
-        subject_ids = raw_data["subject_id"]
-        data_key = str(raw_data["session_id"])
-        responses_train = raw_data["training_responses"].astype(np.float32)
-        responses_test = raw_data["testing_responses"].astype(np.float32)
-        training_image_ids = raw_data["training_image_ids"] - image_id_offset
-        testing_image_ids = raw_data["testing_image_ids"] - image_id_offset
-
-        if dataset != 'PlosCB19_V1':
-            if len(responses_test.shape) != 3:
-                responses_test = responses_test[None, ...]
-                responses_train = responses_train[None, ...]
-                # correct the shape of the responses for a session that was exported incorrectly
-                if data_key != '3653663964522':
-                    warnings.warn("Pickle file with invalid response shape detected")
 
-            responses_test = responses_test.transpose((2, 0, 1))
-            responses_train = responses_train.transpose((2, 0, 1))
-
-            if time_bins_sum is not None:  # then average over given time bins
-                responses_train = (np.mean if avg else np.sum)(responses_train[:, :, time_bins_sum], axis=-1)
-                responses_test = (np.mean if avg else np.sum)(responses_test[:, :, time_bins_sum], axis=-1)
-
-        if image_frac[i] < 1:
-            if randomize_image_selection:
-                image_selection_seed = int(image_selection_seed*image_frac[i])
-            idx_out = get_fraction_of_training_images(image_ids=training_image_ids, fraction=image_frac[i], seed=image_selection_seed)
-            training_image_ids = training_image_ids[idx_out]
-            responses_train = responses_train[idx_out]
-
-        train_idx = np.isin(training_image_ids, all_train_ids)
-        val_idx = np.isin(training_image_ids, all_validation_ids)
-
-        responses_val = responses_train[val_idx]
-        responses_train = responses_train[train_idx]
-
-        validation_image_ids = training_image_ids[val_idx]
-        training_image_ids = training_image_ids[train_idx]
+    # boolean lookup tables over the image id range: membership of the train/val
+    # partition then costs a single gather per session instead of two np.isin scans
+    is_train = np.zeros(int(n_images) + 1, dtype=bool)
+    is_train[all_train_ids] = True
+    is_val = np.zeros_like(is_train)
+    is_val[all_validation_ids] = True
+    
+    # keep up to two session pickles in flight so deserialization of the next
+    # session overlaps with the numpy preprocessing of the current one
+    prefetch_pool = ThreadPoolExecutor(max_workers=2)
+    raw_data_futures = [prefetch_pool.submit(_load_session_pickle, p, os.path.getmtime(p))
+                        for p in neuronal_data_files]
 
-        train_loader = get_cached_loader(training_image_ids, responses_train, batch_size=batch_size, image_cache=cache, shuffle=train_shuffle)
-        val_loader = get_cached_loader(validation_image_ids, responses_val, batch_size=batch_size, image_cache=cache, shuffle=validation_shuffle)
-        test_loader = get_cached_loader(testing_image_ids,
-                                        responses_test,
-                                        batch_size=None,
-                                        shuffle=False,
-                                        image_cache=cache,
-                                        repeat_condition=testing_image_ids)
+    # collect offending sessions and warn once after the loop, instead of
+    # walking the warnings registry once per session
+    invalid_shape_sessions = []
 
-        dataloaders["train"][data_key] = train_loader
-        dataloaders["validation"][data_key] = val_loader
-        dataloaders["test"][data_key] = test_loader
+    # cycling through all datafiles to fill the dataloaders with an entry per session
+    try:
+        for i, datapath in enumerate(neuronal_data_files):
+
+            raw_data = raw_data_futures[i].result()
+
+            subject_ids = raw_data["subject_id"]
+            data_key = str(raw_data["session_id"])
+            responses_train = raw_data["training_responses"].astype(np.float32, copy=False)
+            responses_test = raw_data["testing_responses"].astype(np.float32, copy=False)
+            training_image_ids = raw_data["training_image_ids"] - image_id_offset
+            testing_image_ids = raw_data["testing_image_ids"] - image_id_offset
+
+            if is_non_plos:
+                if len(responses_test.shape) != 3:
+                    responses_test = responses_test[None, ...]
+                    responses_train = responses_train[None, ...]
+                    # correct the shape of the responses for a session that was exported incorrectly
+                    if data_key != '3653663964522':
+                        invalid_shape_sessions.append(data_key)
+
+                if reduce_time_bins:  # then average over given time bins, on the raw layout
+                    responses_train = _reduce_time_bins(responses_train, time_bins_sum, avg)
+                    responses_test = _reduce_time_bins(responses_test, time_bins_sum, avg)
+                else:
+                    responses_test = _to_images_first(responses_test)
+                    responses_train = _to_images_first(responses_train)
+
+            if image_frac[i] < 1:
+                if randomize_image_selection:
+                    image_selection_seed = int(image_selection_seed*image_frac[i])
+                idx_out = get_fraction_of_training_images(image_ids=training_image_ids, fraction=image_frac[i], seed=image_selection_seed)
+                training_image_ids = training_image_ids[idx_out]
+                responses_train = responses_train[idx_out]
+
+            train_idx = is_train[training_image_ids]
+            val_idx = is_val[training_image_ids]
+
+            ((responses_train, responses_val),
+             (training_image_ids, validation_image_ids)) = _partition_train_val(
+                train_idx, val_idx, responses_train, training_image_ids)
+
+            train_loader = get_cached_loader(training_image_ids, responses_train, batch_size=batch_size, image_cache=cache, shuffle=train_shuffle,
+                                             num_workers=num_workers, pin_memory=pin_memory)
+            val_loader = get_cached_loader(validation_image_ids, responses_val, batch_size=batch_size, image_cache=cache, shuffle=validation_shuffle,
+                                             num_workers=num_workers, pin_memory=pin_memory)
+            test_loader = get_cached_loader(testing_image_ids,
+                                            responses_test,
+                                            batch_size=None,
+                                            shuffle=False,
+                                            image_cache=cache,
+                                            repeat_condition=testing_image_ids)
 
+            dataloaders["train"][data_key] = train_loader
+            dataloaders["validation"][data_key] = val_loader
+            dataloaders["test"][data_key] = test_loader
+    finally:
+        # join the pools even when a session fails, so neither the prefetch
+        # threads nor the background z-scoring keep mutating the pooled cache
+        # after the caller has already seen the error
+        prefetch_pool.shutdown()
+        if stats_future is not None:
+            stats_worker.shutdown()
+
+    if invalid_shape_sessions:
+        warnings.warn("Pickle files with invalid response shape detected in sessions: "
+                      "{}".format(invalid_shape_sessions))
+
+    if stats_future is not None:
+        # the worker thread is already joined above; surface any z-scoring
+        # error and adopt the freshly computed statistics
+        stats_future.result()
+        cache.pin_cached_images()
+        img_mean = cache.img_mean
+        img_std = cache.img_std
 
-    if store_data_info and not os.path.exists(stats_path):
+    if store_data_info and not _data_info_exists(stats_path):
 
-        in_name, out_name = next(iter(list(dataloaders["train"].values())[0]))._fields
+        in_name, out_name = next(iter(next(iter(dataloaders["train"].values()))))._fields
 
         session_shape_dict = get_dims_for_loader_dict(dataloaders["train"])
         n_neurons_dict = {k: v[out_name][1] for k, v in session_shape_dict.items()}
@@ -224,8 +494,7 @@ def monkey_static_loader(dataset,
         stats_path_base =  str(Path(stats_path).parent)
         if not os.path.exists(stats_path_base):
             os.mkdir(stats_path_base)
-        with open(stats_path, "wb") as pkl:
-            pickle.dump(data_info, pkl)
+        _save_data_info(data_info, stats_path)
 
     return dataloaders if not return_data_info else data_info
 
@@ -246,7 +515,9 @@ def monkey_mua_sua_loader(dataset,
                          return_data_info=False,
                          store_data_info=True,
                          mua_selector=None,
-                         add_eye_movement=None):
+                         add_eye_movement=None,
+                         num_workers=0,
+                         pin_memory=True):
     """
     Function that returns cached dataloaders for monkey ephys experiments.
 
@@ -287,7 +558,23 @@ def monkey_mua_sua_loader(dataset,
     Returns: nested dictionary of dataloaders
     """
 
-    dataset_config = locals()
+    # restrict the config hash input to the arguments that actually parameterize
+    # the cached statistics, instead of hashing every local (which can include
+    # large arrays when img_mean/img_std are passed in)
+    dataset_config = dict(dataset=dataset,
+                          neuronal_data_files=neuronal_data_files,
+                          mua_data_files=mua_data_files,
+                          subsample=subsample,
+                          crop=crop,
+                          scale=scale,
+                          time_bins_sum=time_bins_sum,
+                          avg=avg,
+                          add_eye_movement=add_eye_movement,
+                          # the selector decides how many MUA units get merged per
+                          # session, which sets the output dimension stored in the
+                          # cached data_info - it has to be part of the hash
+                          mua_selector=None if mua_selector is None else
+                          {k: np.asarray(v).tolist() for k, v in mua_selector.items()})
 
     # initialize dataloaders as empty dict
     dataloaders = {'train': {}, 'validation': {}, 'test': {}}
@@ -302,157 +589,196 @@ def monkey_mua_sua_loader(dataset,
     image_cache_path = image_cache_path.split('individual')[0]
 
     # Load image statistics if present
-    stats_filename = make_hash(dataset_config)
+    stats_filename = _config_hash(dataset_config)
     stats_path = os.path.join(image_cache_path, 'statistics/', stats_filename)
 
     # Get mean and std
 
-    if os.path.exists(stats_path):
-        with open(stats_path, "rb") as pkl:
-            data_info = pickle.load(pkl)
+    stats_future = None
+    if _data_info_exists(stats_path):
+        data_info = _load_data_info(stats_path)
         if return_data_info:
             return data_info
-        img_mean = list(data_info.values())[0]["img_mean"]
-        img_std = list(data_info.values())[0]["img_std"]
+        img_mean = next(iter(data_info.values()))["img_mean"]
+        img_std = next(iter(data_info.values()))["img_std"]
 
         # Initialize cache
-        cache = ImageCache(path=image_cache_path, subsample=subsample, crop=crop, scale=scale, img_mean=img_mean,
+        cache = get_image_cache(path=image_cache_path, subsample=subsample, crop=crop, scale=scale, img_mean=img_mean,
                            img_std=img_std, transform=True, normalize=True)
     else:
         # Initialize cache with no normalization
-        cache = ImageCache(path=image_cache_path, subsample=subsample, crop=crop, scale=scale, transform=True,
+        cache = get_image_cache(path=image_cache_path, subsample=subsample, crop=crop, scale=scale, transform=True,
                            normalize=False)
 
-        # Compute mean and std of transformed images and zscore data (the cache wil be filled so first epoch will be fast)
-        cache.zscore_images(update_stats=True)
-        img_mean = cache.img_mean
-        img_std = cache.img_std
+        if cache.img_mean is not None:
+            # a pooled cache from an earlier call already carries the statistics
+            img_mean = cache.img_mean
+            img_std = cache.img_std
+        else:
+            # Compute mean and std of transformed images and zscore data in a background
+            # thread, overlapped with the session pickle processing below
+            stats_worker = ThreadPoolExecutor(max_workers=1)
+            stats_future = stats_worker.submit(cache.zscore_images, update_stats=True)
 
     n_images = len(cache)
     data_info = {}
 
     # set up parameters for the different dataset types
-    if dataset == 'PlosCB19_V1':
+    # hoist the dataset-type checks out of the per-session loop
+    is_non_plos = dataset != 'PlosCB19_V1'
+    reduce_time_bins = is_non_plos and time_bins_sum is not None
+
+    if not is_non_plos:
         # for the "Amadeus V1" Dataset, recorded by Santiago Cadena, there was no specified test set.
         # instead, the last 20% of the dataset were classified as test set. To make sure that the test set
-        # of this dataset will always stay identical, the `train_test_split` value is hardcoded here.
-        train_test_split = 0.8
+        # of this dataset will always stay identical, the 0.8 train/test split is hardcoded here.
+        split_n = int(n_images * 0.8)
         image_id_offset = 1
     else:
-        train_test_split = 1
+        split_n = n_images
         image_id_offset = 0
 
-    all_train_ids, all_validation_ids = get_validation_split(n_images=n_images * train_test_split,
+    all_train_ids, all_validation_ids = get_validation_split(n_images=split_n,
                                                              train_frac=train_frac,
                                                              seed=seed)
 
-    # cycling through all datafiles to fill the dataloaders with an entry per session
-    for i, datapath in enumerate(neuronal_data_files):
+    # boolean lookup tables over the image id range: membership of the train/val
+    # partition then costs a single gather per session instead of two np.isin scans
+    is_train = np.zeros(int(n_images) + 1, dtype=bool)
+    is_train[all_train_ids] = True
+    is_val = np.zeros_like(is_train)
+    is_val[all_validation_ids] = True
+
+    # keep up to two session pickles in flight so deserialization of the next
+    # session overlaps with the numpy preprocessing of the current one
+    prefetch_pool = ThreadPoolExecutor(max_workers=2)
+    raw_data_futures = [prefetch_pool.submit(_load_session_pickle, p, os.path.getmtime(p))
+                        for p in neuronal_data_files]
+    mua_futures = [prefetch_pool.submit(_load_session_pickle, p, os.path.getmtime(p))
+                   for p in mua_data_files]
+
+    # index the MUA files by session once, instead of re-reading every file per session
+    mua_index = {}
+    for future in mua_futures:
+        mua_data = future.result()
+        mua_index[str(mua_data["session_id"])] = mua_data
 
-        with open(datapath, "rb") as pkl:
-            raw_data = pickle.load(pkl)
+    # cycling through all datafiles to fill the dataloaders with an entry per session
+    try:
+        for i, datapath in enumerate(neuronal_data_files):
+
+            raw_data = raw_data_futures[i].result()
+
+            subject_ids = raw_data["subject_id"]
+            data_key = str(raw_data["session_id"])
+            responses_train = raw_data["training_responses"].astype(np.float32, copy=False)
+            responses_test = raw_data["testing_responses"].astype(np.float32, copy=False)
+            training_image_ids = raw_data["training_image_ids"] - image_id_offset
+            testing_image_ids = raw_data["testing_image_ids"] - image_id_offset
+
+            if add_eye_movement:
+                if "avg_horizontal_eye_position_training_images" in raw_data:
+                    eye_pos_h_train = raw_data["avg_horizontal_eye_position_training_images"].astype(np.float32, copy=False)
+                    eye_pos_v_train = raw_data["avg_vertical_eye_position_training_images"].astype(np.float32, copy=False)
+                    eye_pos_h_test = raw_data["avg_horizontal_eye_position_testing_images"].astype(np.float32, copy=False)
+                    eye_pos_v_test = raw_data["avg_vertical_eye_position_testing_images"].astype(np.float32, copy=False)
+
+                    eye_pos_train = _zscore_eye_positions(eye_pos_h_train, eye_pos_v_train)
+                    eye_pos_test = _zscore_eye_positions(eye_pos_h_test, eye_pos_v_test)
+                else:
+                    raise(FileNotFoundError, "Eye movement data is not found in the pickle file.")
 
-        subject_ids = raw_data["subject_id"]
-        data_key = str(raw_data["session_id"])
-        responses_train = raw_data["training_responses"].astype(np.float32)
-        responses_test = raw_data["testing_responses"].astype(np.float32)
-        training_image_ids = raw_data["training_image_ids"] - image_id_offset
-        testing_image_ids = raw_data["testing_image_ids"] - image_id_offset
 
-        if add_eye_movement:
-            if "avg_horizontal_eye_position_training_images" in raw_data:
-                eye_pos_h_train = raw_data["avg_horizontal_eye_position_training_images"].astype(np.float32)
-                eye_pos_v_train = raw_data["avg_vertical_eye_position_training_images"].astype(np.float32)
-                eye_pos_h_test = raw_data["avg_horizontal_eye_position_testing_images"].astype(np.float32)
-                eye_pos_v_test = raw_data["avg_vertical_eye_position_testing_images"].astype(np.float32)
-
-                eye_pos_train = np.vstack([eye_pos_h_train, eye_pos_v_train]).T
-                eye_pos_train = scipy.stats.zscore(eye_pos_train)
-                eye_pos_test = np.vstack([eye_pos_h_test, eye_pos_v_test]).T
-                eye_pos_test = scipy.stats.zscore(eye_pos_test)
+            mua_data = mua_index.get(data_key)
+            if mua_data is None:
+                print("session {} does not exist in MUA. Skipping MUA".format(data_key))
             else:
-                raise(FileNotFoundError, "Eye movement data is not found in the pickle file.")
-
-
-        for mua_data_path in mua_data_files:
-            with open(mua_data_path, "rb") as mua_pkl:
-                mua_data = pickle.load(mua_pkl)
-
-            if str(mua_data["session_id"]) == data_key:
                 if mua_selector is not None:
                     selected_mua = mua_selector[data_key]
                 else:
                     selected_mua = np.ones(len(mua_data["unit_ids"])).astype(bool)
-                mua_responses_train = mua_data["training_responses"].astype(np.float32)[selected_mua]
-                mua_responses_test = mua_data["testing_responses"].astype(np.float32)[selected_mua]
+                mua_responses_train = mua_data["training_responses"].astype(np.float32, copy=False)[selected_mua]
+                mua_responses_test = mua_data["testing_responses"].astype(np.float32, copy=False)[selected_mua]
                 mua_training_image_ids = mua_data["training_image_ids"] - image_id_offset
                 mua_testing_image_ids = mua_data["testing_image_ids"] - image_id_offset
-                break
 
-        if not str(mua_data["session_id"]) == data_key:
-            print("session {} does not exist in MUA. Skipping MUA".format(data_key))
-        else:
-            if not np.array_equal(training_image_ids, mua_training_image_ids):
-                raise ValueError("Training image IDs do not match between the spike sorted data and mua data")
-            if not np.array_equal(testing_image_ids, mua_testing_image_ids):
-                raise ValueError("Testing image IDs do not match between the spike sorted data and mua data")
-
-            if len(responses_train.shape) < 3:
-                responses_train = responses_train[None, ...]
-                responses_test = responses_test[None, ...]
-            responses_train = np.concatenate([responses_train, mua_responses_train], axis=0)
-            responses_test = np.concatenate([responses_test, mua_responses_test], axis=0)
-
-
-        if dataset != 'PlosCB19_V1':
-            responses_test = responses_test.transpose((2, 0, 1))
-            responses_train = responses_train.transpose((2, 0, 1))
-
-            if time_bins_sum is not None:  # then average over given time bins
-                responses_train = (np.mean if avg else np.sum)(responses_train[:, :, time_bins_sum], axis=-1)
-                responses_test = (np.mean if avg else np.sum)(responses_test[:, :, time_bins_sum], axis=-1)
-
-        train_idx = np.isin(training_image_ids, all_train_ids)
-        val_idx = np.isin(training_image_ids, all_validation_ids)
-
-        responses_val = responses_train[val_idx]
-        responses_train = responses_train[train_idx]
-        if add_eye_movement:
-            eye_pos_val = eye_pos_train[val_idx]
-            eye_pos_train = eye_pos_train[train_idx]
-
-        validation_image_ids = training_image_ids[val_idx]
-        training_image_ids = training_image_ids[train_idx]
-
-        if add_eye_movement:
-            train_loader = get_cached_loader(training_image_ids, responses_train, eye_pos_train, batch_size=batch_size,
-                                             image_cache=cache)
-            val_loader = get_cached_loader(validation_image_ids, responses_val, eye_pos_val, batch_size=batch_size,
-                                           image_cache=cache)
-            test_loader = get_cached_loader(testing_image_ids,
-                                            responses_test,
-                                            eye_pos_test,
-                                            batch_size=None,
-                                            shuffle=None,
-                                            image_cache=cache,
-                                            repeat_condition=testing_image_ids)
-        else:
-            train_loader = get_cached_loader(training_image_ids, responses_train, batch_size=batch_size, image_cache=cache)
-            val_loader = get_cached_loader(validation_image_ids, responses_val, batch_size=batch_size, image_cache=cache)
-            test_loader = get_cached_loader(testing_image_ids,
-                                            responses_test,
-                                            batch_size=None,
-                                            shuffle=None,
-                                            image_cache=cache,
-                                            repeat_condition=testing_image_ids)
+                if not np.array_equal(training_image_ids, mua_training_image_ids):
+                    raise ValueError("Training image IDs do not match between the spike sorted data and mua data")
+                if not np.array_equal(testing_image_ids, mua_testing_image_ids):
+                    raise ValueError("Testing image IDs do not match between the spike sorted data and mua data")
 
-        dataloaders["train"][data_key] = train_loader
-        dataloaders["validation"][data_key] = val_loader
-        dataloaders["test"][data_key] = test_loader
+                if len(responses_train.shape) < 3:
+                    responses_train = responses_train[None, ...]
+                    responses_test = responses_test[None, ...]
+                responses_train = _merge_unit_blocks(responses_train, mua_responses_train)
+                responses_test = _merge_unit_blocks(responses_test, mua_responses_test)
 
-    if store_data_info and not os.path.exists(stats_path):
 
-        in_name, out_name = next(iter(list(dataloaders["train"].values())[0]))._fields[:2]
+            if is_non_plos:
+                if reduce_time_bins:  # then average over given time bins, on the raw layout
+                    responses_train = _reduce_time_bins(responses_train, time_bins_sum, avg)
+                    responses_test = _reduce_time_bins(responses_test, time_bins_sum, avg)
+                else:
+                    responses_test = _to_images_first(responses_test)
+                    responses_train = _to_images_first(responses_train)
+
+            train_idx = is_train[training_image_ids]
+            val_idx = is_val[training_image_ids]
+
+            ((responses_train, responses_val),
+             (training_image_ids, validation_image_ids)) = _partition_train_val(
+                train_idx, val_idx, responses_train, training_image_ids)
+            if add_eye_movement:
+                ((eye_pos_train, eye_pos_val),) = _partition_train_val(train_idx, val_idx, eye_pos_train)
+
+            if add_eye_movement:
+                train_loader = get_cached_loader(training_image_ids, responses_train, eye_pos_train, batch_size=batch_size,
+                                                 image_cache=cache,
+                                             num_workers=num_workers, pin_memory=pin_memory)
+                val_loader = get_cached_loader(validation_image_ids, responses_val, eye_pos_val, batch_size=batch_size,
+                                               image_cache=cache,
+                                             num_workers=num_workers, pin_memory=pin_memory)
+                test_loader = get_cached_loader(testing_image_ids,
+                                                responses_test,
+                                                eye_pos_test,
+                                                batch_size=None,
+                                                shuffle=None,
+                                                image_cache=cache,
+                                                repeat_condition=testing_image_ids)
+            else:
+                train_loader = get_cached_loader(training_image_ids, responses_train, batch_size=batch_size, image_cache=cache,
+                                             num_workers=num_workers, pin_memory=pin_memory)
+                val_loader = get_cached_loader(validation_image_ids, responses_val, batch_size=batch_size, image_cache=cache,
+                                             num_workers=num_workers, pin_memory=pin_memory)
+                test_loader = get_cached_loader(testing_image_ids,
+                                                responses_test,
+                                                batch_size=None,
+                                                shuffle=None,
+                                                image_cache=cache,
+                                                repeat_condition=testing_image_ids)
+
+            dataloaders["train"][data_key] = train_loader
+            dataloaders["validation"][data_key] = val_loader
+            dataloaders["test"][data_key] = test_loader
+    finally:
+        # join the pools even when a session fails, so neither the prefetch
+        # threads nor the background z-scoring keep mutating the pooled cache
+        # after the caller has already seen the error
+        prefetch_pool.shutdown()
+        if stats_future is not None:
+            stats_worker.shutdown()
+
+    if stats_future is not None:
+        # the worker thread is already joined above; surface any z-scoring
+        # error and adopt the freshly computed statistics
+        stats_future.result()
+        cache.pin_cached_images()
+        img_mean = cache.img_mean
+        img_std = cache.img_std
+
+    if store_data_info and not _data_info_exists(stats_path):
+
+        in_name, out_name = next(iter(next(iter(dataloaders["train"].values()))))._fields[:2]
 
         session_shape_dict = get_dims_for_loader_dict(dataloaders["train"])
         n_neurons_dict = {k: v[out_name][1] for k, v in session_shape_dict.items()}
@@ -469,8 +795,7 @@ def monkey_mua_sua_loader(dataset,
         stats_path_base = str(Path(stats_path).parent)
         if not os.path.exists(stats_path_base):
             os.mkdir(stats_path_base)
-        with open(stats_path, "wb") as pkl:
-            pickle.dump(data_info, pkl)
+        _save_data_info(data_info, stats_path)
 
     return dataloaders if not return_data_info else data_info
 
@@ -496,7 +821,11 @@ def monkey_static_loader_closed_loop(dataset,
                          img_mean=None,
                          img_std=None,
                          include_mei_training=False,
-                         include_control_training=False):
+                         include_control_training=False,
+                         build_mei_loaders=True,
+                         build_control_loaders=True,
+                         num_workers=0,
+                         pin_memory=True):
     """
     Function that returns cached dataloaders for monkey ephys experiments.
 
@@ -537,20 +866,36 @@ def monkey_static_loader_closed_loop(dataset,
     Returns: nested dictionary of dataloaders
     """
 
-    dataset_config = locals()
+    # restrict the config hash input to the arguments that actually parameterize
+    # the cached statistics, instead of hashing every local (which can include
+    # large arrays when img_mean/img_std are passed in)
+    dataset_config = dict(dataset=dataset,
+                          neuronal_data_files=neuronal_data_files,
+                          subsample=subsample,
+                          crop=crop,
+                          scale=scale,
+                          time_bins_sum=time_bins_sum,
+                          avg=avg,
+                          image_frac=image_frac,
+                          stimulus_location=stimulus_location,
+                          include_mei_training=include_mei_training,
+                          include_control_training=include_control_training)
 
     if include_mei_training and include_control_training:
         raise ValueError("the entire test can not be included into the training set. Set either 'include_mei_training' "
                          "or 'include_control_training' to False.")
 
-    # initialize dataloaders as empty dict
+    # initialize dataloaders as empty dict; the mei/control evaluation loaders
+    # are only set up when requested, so disabled runs skip their construction
     dataloaders = {'train': {},
                    'validation': {},
-                   'test': {},
-                   'test_mei_uncropped': {},
-                   'test_control_uncropped': {},
-                   'test_mei_cropped': {},
-                   'test_control_cropped': {}}
+                   'test': {}}
+    if build_mei_loaders:
+        dataloaders['test_mei_uncropped'] = {}
+        dataloaders['test_mei_cropped'] = {}
+    if build_control_loaders:
+        dataloaders['test_control_uncropped'] = {}
+        dataloaders['test_control_cropped'] = {}
 
     if include_mei_training or include_control_training:
         dataloaders["validation_extended"] = {}
@@ -562,7 +907,7 @@ def monkey_static_loader_closed_loop(dataset,
         crop = [(crop, crop), (crop, crop)]
 
     if not isinstance(image_frac, Iterable):
-        image_frac = [image_frac for i in neuronal_data_files]
+        image_frac = [image_frac] * len(neuronal_data_files)
 
     if not isinstance(stimulus_location, Iterable):
         stimulus_location = [stimulus_location for i in neuronal_data_files]
@@ -571,73 +916,103 @@ def monkey_static_loader_closed_loop(dataset,
     image_cache_path = image_cache_path.split('individual')[0]
 
     # Load image statistics if present
-    stats_filename = make_hash(dataset_config)
+    stats_filename = _config_hash(dataset_config)
 
     stats_path = os.path.join(image_cache_path, 'statistics/', stats_filename)
 
     # Get mean and std
-    if os.path.exists(stats_path):
-        with open(stats_path, "rb") as pkl:
-            data_info = pickle.load(pkl)
+    if _data_info_exists(stats_path):
+        data_info = _load_data_info(stats_path)
         if return_data_info:
             return data_info
-        img_mean = list(data_info.values())[0]["img_mean"]
-        img_std = list(data_info.values())[0]["img_std"]
+        img_mean = next(iter(data_info.values()))["img_mean"]
+        img_std = next(iter(data_info.values()))["img_std"]
 
         # Initialize cache
-        cache = ImageCache(path=image_cache_path, subsample=subsample, crop=crop, scale=scale, img_mean=img_mean,
+        cache = get_image_cache(path=image_cache_path, subsample=subsample, crop=crop, scale=scale, img_mean=img_mean,
                            img_std=img_std, transform=True, normalize=True)
     else:
         if img_mean is not None:
-            cache = ImageCache(path=image_cache_path, subsample=subsample, crop=crop, scale=scale, img_mean=img_mean,
+            cache = get_image_cache(path=image_cache_path, subsample=subsample, crop=crop, scale=scale, img_mean=img_mean,
                                img_std=img_std, transform=True, normalize=True)
         else:
 
             # Initialize cache with no normalization
-            cache = ImageCache(path=image_cache_path, subsample=subsample, crop=crop, scale=scale, transform=True,
+            cache = get_image_cache(path=image_cache_path, subsample=subsample, crop=crop, scale=scale, transform=True,
                                normalize=False)
 
-            # Compute mean and std of transformed images and zscore data (the cache wil be filled so first epoch will be fast)
-            cache.zscore_images(update_stats=True)
+            # Compute mean and std of transformed images and zscore data (the cache wil be
+            # filled so first epoch will be fast). Kept eager here: the per-session caches
+            # below need the statistics immediately.
+            if cache.img_mean is None:
+                cache.zscore_images(update_stats=True)
+                cache.pin_cached_images()
             img_mean = cache.img_mean
             img_std = cache.img_std
 
     n_images = len(cache)
     data_info = {}
-    if stimulus_location is not None:
-        TrainImageCaches = {}
-        TestImageCaches = {}
+    TrainImageCaches = {}
+    TestImageCaches = {}
 
     # set up parameters for the different dataset types
-    if dataset == 'PlosCB19_V1':
+    # hoist the dataset-type checks out of the per-session loop
+    is_non_plos = dataset != 'PlosCB19_V1'
+    reduce_time_bins = is_non_plos and time_bins_sum is not None
+
+    if not is_non_plos:
         # for the "Amadeus V1" Dataset, recorded by Santiago Cadena, there was no specified test set.
         # instead, the last 20% of the dataset were classified as test set. To make sure that the test set
-        # of this dataset will always stay identical, the `train_test_split` value is hardcoded here.
-        train_test_split = 0.8
+        # of this dataset will always stay identical, the 0.8 train/test split is hardcoded here.
+        split_n = int(n_images * 0.8)
         image_id_offset = 1
     else:
-        train_test_split = 1
+        split_n = n_images
         image_id_offset = 0
 
-    all_train_ids, all_validation_ids = get_validation_split(n_images=n_images * train_test_split,
+    all_train_ids, all_validation_ids = get_validation_split(n_images=split_n,
                                                              train_frac=train_frac,
                                                              seed=seed)
 
-    # cycling through all datafiles to fill the dataloaders with an entry per session
-    for i, datapath in enumerate(neuronal_data_files):
+    # boolean lookup tables over the image id range: membership of the train/val
+    # partition then costs a single gather per session instead of two np.isin scans
+    is_train = np.zeros(int(n_images) + 1, dtype=bool)
+    is_train[all_train_ids] = True
+    is_val = np.zeros_like(is_train)
+    is_val[all_validation_ids] = True
+
+    # keep up to two session pickles in flight so deserialization of the next
+    # session overlaps with the numpy preprocessing of the current one
+    prefetch_pool = ThreadPoolExecutor(max_workers=2)
+    raw_data_futures = [prefetch_pool.submit(_load_session_pickle, p, os.path.getmtime(p))
+                        for p in neuronal_data_files]
 
-        with open(datapath, "rb") as pkl:
-            raw_data = pickle.load(pkl)
+    if stimulus_location is not None:
+        # precompute the per-session crops in one shot; the clip/subtract math
+        # runs vectorized over all sessions instead of once per iteration
+        all_training_crops = np.stack([
+            get_crop_from_stimulus_location(location, crop, monitor_scaling_factor=4.57)
+            for location in stimulus_location])
+        all_test_crops = np.asarray(crop) - np.clip(all_training_crops, -999, 0)
+
+    def build_session(i):
+        """
+        Builds the loader entries of one session. All state is session-local, so
+        sessions can be built concurrently - the pickle reads and the large numpy
+        operations release the GIL.
+        """
+        raw_data = raw_data_futures[i].result()
 
         subject_ids = raw_data["subject_id"]
         data_key = str(raw_data["session_id"])
-        responses_train = raw_data["training_responses"].astype(np.float32)
-        responses_test = raw_data["testing_responses"].astype(np.float32)
+        responses_train = raw_data["training_responses"].astype(np.float32, copy=False)
+        responses_test = raw_data["testing_responses"].astype(np.float32, copy=False)
 
-        mei_uncropped_responses = raw_data["mei_uncropped_responses"].astype(np.float32)
-        control_uncropped_responses = raw_data["control_uncropped_responses"].astype(np.float32)
-        mei_cropped_responses = raw_data["mei_cropped_responses"].astype(np.float32)
-        control_cropped_responses = raw_data["control_cropped_responses"].astype(np.float32)
+        # converted to float32 lazily at the point of use, see _f32 below
+        mei_uncropped_responses = raw_data["mei_uncropped_responses"]
+        control_uncropped_responses = raw_data["control_uncropped_responses"]
+        mei_cropped_responses = raw_data["mei_cropped_responses"]
+        control_cropped_responses = raw_data["control_cropped_responses"]
 
         training_image_ids = raw_data["training_image_ids"] - image_id_offset
         testing_image_ids = raw_data["testing_image_ids"] - image_id_offset
@@ -648,28 +1023,31 @@ def monkey_static_loader_closed_loop(dataset,
         control_cropped_ids = raw_data["control_cropped_ids"]
 
 
-        if dataset != 'PlosCB19_V1':
-            responses_test = responses_test.transpose((2, 0, 1))
-            responses_train = responses_train.transpose((2, 0, 1))
-
-            mei_uncropped_responses = mei_uncropped_responses.transpose((2, 0, 1))
-            control_uncropped_responses = control_uncropped_responses.transpose((2, 0, 1))
-            mei_cropped_responses = mei_cropped_responses.transpose((2, 0, 1))
-            control_cropped_responses = control_cropped_responses.transpose((2, 0, 1))
+        if is_non_plos:
+            if reduce_time_bins:  # then average over given time bins, on the raw layout
+                responses_train = _reduce_time_bins(responses_train, time_bins_sum, avg)
+                responses_test = _reduce_time_bins(responses_test, time_bins_sum, avg)
+                mei_uncropped_responses = _reduce_time_bins(mei_uncropped_responses, time_bins_sum, avg)
+                control_uncropped_responses = _reduce_time_bins(control_uncropped_responses, time_bins_sum, avg)
+                mei_cropped_responses = _reduce_time_bins(mei_cropped_responses, time_bins_sum, avg)
+                control_cropped_responses = _reduce_time_bins(control_cropped_responses, time_bins_sum, avg)
+            else:
+                responses_test = _to_images_first(responses_test)
+                responses_train = _to_images_first(responses_train)
 
-            if time_bins_sum is not None:  # then average over given time bins
-                responses_train = (np.mean if avg else np.sum)(responses_train[:, :, time_bins_sum], axis=-1)
-                responses_test = (np.mean if avg else np.sum)(responses_test[:, :, time_bins_sum], axis=-1)
-                mei_uncropped_responses = (np.mean if avg else np.sum)(mei_uncropped_responses[:, :, time_bins_sum], axis=-1)
-                control_uncropped_responses = (np.mean if avg else np.sum)(control_uncropped_responses[:, :, time_bins_sum], axis=-1)
-                mei_cropped_responses = (np.mean if avg else np.sum)(mei_cropped_responses[:, :, time_bins_sum], axis=-1)
-                control_cropped_responses = (np.mean if avg else np.sum)(control_cropped_responses[:, :, time_bins_sum], axis=-1)
+                mei_uncropped_responses = _to_images_first(mei_uncropped_responses)
+                control_uncropped_responses = _to_images_first(control_uncropped_responses)
+                mei_cropped_responses = _to_images_first(mei_cropped_responses)
+                control_cropped_responses = _to_images_first(control_cropped_responses)
 
         if image_frac[i] < 1:
+            # derive a session-local seed instead of mutating the shared argument,
+            # keeping the selection independent of session build order
+            selection_seed = image_selection_seed
             if randomize_image_selection:
-                image_selection_seed = int(image_selection_seed * image_frac)
-            idx_out = get_fraction_of_training_images(image_ids=training_image_ids, fraction=image_frac,
-                                                      seed=image_selection_seed)
+                selection_seed = int(image_selection_seed * image_frac[i])
+            idx_out = get_fraction_of_training_images(image_ids=training_image_ids, fraction=image_frac[i],
+                                                      seed=selection_seed)
             training_image_ids = training_image_ids[idx_out]
             responses_train = responses_train[idx_out]
 
@@ -678,128 +1056,121 @@ def monkey_static_loader_closed_loop(dataset,
             responses_train_original = responses_train
 
         if include_control_training:
-            training_image_ids = np.append(training_image_ids, control_cropped_ids)
-            training_image_ids = np.append(training_image_ids, control_uncropped_ids)
-
-            responses_train = np.vstack([responses_train, control_cropped_responses])
-            responses_train = np.vstack([responses_train, control_uncropped_responses])
+            training_image_ids = np.concatenate([training_image_ids, control_cropped_ids, control_uncropped_ids])
+            responses_train = np.vstack([responses_train, _f32(control_cropped_responses), _f32(control_uncropped_responses)])
 
         if include_mei_training:
-            training_image_ids = np.append(training_image_ids, mei_cropped_ids)
-            training_image_ids = np.append(training_image_ids, mei_uncropped_ids)
-
-            responses_train = np.vstack([responses_train, mei_cropped_responses])
-            responses_train = np.vstack([responses_train, mei_uncropped_responses])
+            training_image_ids = np.concatenate([training_image_ids, mei_cropped_ids, mei_uncropped_ids])
+            responses_train = np.vstack([responses_train, _f32(mei_cropped_responses), _f32(mei_uncropped_responses)])
 
-        train_idx = np.isin(training_image_ids, all_train_ids)
-        val_idx = np.isin(training_image_ids, all_validation_ids)
+        train_idx = is_train[training_image_ids]
+        val_idx = is_val[training_image_ids]
 
-        responses_val = responses_train[val_idx]
-        responses_train = responses_train[train_idx]
-        validation_image_ids = training_image_ids[val_idx]
-        training_image_ids = training_image_ids[train_idx]
+        ((responses_train, responses_val),
+         (training_image_ids, validation_image_ids)) = _partition_train_val(
+            train_idx, val_idx, responses_train, training_image_ids)
 
         if include_mei_training or include_control_training:
-            train_idx = np.isin(training_image_ids_original, all_train_ids)
-            val_idx = np.isin(training_image_ids_original, all_validation_ids)
-
-            responses_val_original = responses_train_original[val_idx]
-            responses_train_original = responses_train_original[train_idx]
-            validation_image_ids_original = training_image_ids_original[val_idx]
-            training_image_ids_original = training_image_ids_original[train_idx]
+            # the original arrays are the untouched prefix of the extended ones,
+            # so their membership masks are prefix slices of the masks above
+            n_original = len(training_image_ids_original)
+            ((responses_train_original, responses_val_original),
+             (training_image_ids_original, validation_image_ids_original)) = _partition_train_val(
+                train_idx[:n_original], val_idx[:n_original],
+                responses_train_original, training_image_ids_original)
 
         if stimulus_location is not None:
-            training_crop = get_crop_from_stimulus_location(stimulus_location[i], crop, monitor_scaling_factor=4.57)
-            test_crop = crop - np.clip(training_crop, -999, 0)
+            training_crop = all_training_crops[i]
+            test_crop = all_test_crops[i]
 
+            # sessions sharing the same crop parameters share one pooled cache,
+            # so images are decoded (and z-scored) once per unique crop
             if img_mean is not None:
-                TrainImageCaches[data_key] = ImageCache(path=image_cache_path, subsample=subsample, crop=training_crop, scale=scale,
+                train_cache = get_image_cache(path=image_cache_path, subsample=subsample, crop=training_crop, scale=scale,
                                    img_mean=img_mean, img_std=img_std, transform=True, normalize=True)
 
-                TestImageCaches[data_key] = ImageCache(path=image_cache_path, subsample=subsample, crop=test_crop, scale=scale,
+                test_cache = get_image_cache(path=image_cache_path, subsample=subsample, crop=test_crop, scale=scale,
                                    img_mean=img_mean, img_std=img_std, transform=True, normalize=True)
-
             else:
-                TrainImageCaches[data_key] = ImageCache(path=image_cache_path, subsample=subsample, crop=training_crop, scale=scale, transform=True,
+                train_cache = get_image_cache(path=image_cache_path, subsample=subsample, crop=training_crop, scale=scale, transform=True,
                                    normalize=False)
-                TrainImageCaches[data_key].zscore_images(update_stats=True)
-
-
-
-            train_loader = get_cached_loader(training_image_ids, responses_train, batch_size=batch_size,
-                                             image_cache=TrainImageCaches[data_key])
-            if include_mei_training or include_control_training:
-                val_loader = get_cached_loader(validation_image_ids_original, responses_val_original, batch_size=batch_size,
-                                               image_cache=TrainImageCaches[data_key])
-                val_loader_extended = get_cached_loader(validation_image_ids, responses_val, batch_size=batch_size,
-                                               image_cache=TrainImageCaches[data_key])
-            else:
-                val_loader = get_cached_loader(validation_image_ids, responses_val, batch_size=batch_size,
-                                               image_cache=TrainImageCaches[data_key])
+                if train_cache.img_mean is None:
+                    train_cache.zscore_images(update_stats=True)
+                test_cache = train_cache
         else:
-            train_loader = get_cached_loader(training_image_ids, responses_train, batch_size=batch_size, image_cache=cache)
-            if include_mei_training or include_control_training:
-                val_loader_extended = get_cached_loader(validation_image_ids, responses_val, batch_size=batch_size, image_cache=cache)
-                val_loader = get_cached_loader(validation_image_ids_original,
-                                                responses_val_original,
-                                                batch_size=batch_size,
-                                                image_cache=cache)
-            else:
-                val_loader = get_cached_loader(validation_image_ids, responses_val, batch_size=batch_size,
-                                               image_cache=cache)
-
-            TestImageCaches[data_key] = cache
-
-        test_loader = get_cached_loader(testing_image_ids,
-                                        responses_test,
-                                        batch_size=None,
-                                        shuffle=None,
-                                        image_cache=TestImageCaches[data_key],
-                                        repeat_condition=testing_image_ids)
-
-        mei_uncropped_loader = get_cached_loader(mei_uncropped_ids,
-                                        mei_uncropped_responses,
-                                        batch_size=None,
-                                        shuffle=None,
-                                        image_cache=TestImageCaches[data_key],
-                                        repeat_condition=mei_uncropped_ids)
-
-        control_uncropped_loader = get_cached_loader(control_uncropped_ids,
-                                        control_uncropped_responses,
-                                        batch_size=None,
-                                        shuffle=None,
-                                        image_cache=TestImageCaches[data_key],
-                                        repeat_condition=control_uncropped_ids)
-
-        mei_cropped_loader = get_cached_loader(mei_cropped_ids,
-                                       mei_cropped_responses,
-                                       batch_size=None,
-                                       shuffle=None,
-                                       image_cache=TestImageCaches[data_key],
-                                       repeat_condition=mei_cropped_ids)
-
-        control_cropped_loader = get_cached_loader(control_cropped_ids,
-                                           control_cropped_responses,
-                                           batch_size=None,
-                                           shuffle=None,
-                                           image_cache=TestImageCaches[data_key],
-                                           repeat_condition=control_cropped_ids)
-
-        dataloaders["train"][data_key] = train_loader
-        dataloaders["validation"][data_key] = val_loader
-        dataloaders["test"][data_key] = test_loader
-
-        dataloaders["test_mei_uncropped"][data_key] = mei_uncropped_loader
-        dataloaders["test_mei_cropped"][data_key] = mei_cropped_loader
-        dataloaders["test_control_uncropped"][data_key] = control_uncropped_loader
-        dataloaders["test_control_cropped"][data_key] = control_cropped_loader
+            train_cache = cache
+            test_cache = cache
+
+        # bind the session cache and loader settings once instead of repeating
+        # them across the near-identical get_cached_loader calls below
+        def mkloader(ids, resp, **kwargs):
+            kwargs.setdefault("batch_size", batch_size)
+            kwargs.setdefault("image_cache", train_cache)
+            kwargs.setdefault("num_workers", num_workers)
+            kwargs.setdefault("pin_memory", pin_memory)
+            return get_cached_loader(ids, resp, **kwargs)
+
+        train_loader = mkloader(training_image_ids, responses_train)
+        if include_mei_training or include_control_training:
+            val_loader = mkloader(validation_image_ids_original, responses_val_original)
+            val_loader_extended = mkloader(validation_image_ids, responses_val)
+        else:
+            val_loader = mkloader(validation_image_ids, responses_val)
+
+        # warm the shared per-session cache with the union of ids once, instead
+        # of letting each of the test-style loaders fault in its images
+        preload_ids = [testing_image_ids]
+        if build_mei_loaders:
+            preload_ids += [mei_uncropped_ids, mei_cropped_ids]
+        if build_control_loaders:
+            preload_ids += [control_uncropped_ids, control_cropped_ids]
+        test_cache.preload(np.concatenate(preload_ids), pin_memory=pin_memory)
+
+        entries = {"train": train_loader,
+                   "validation": val_loader,
+                   "test": mkloader(testing_image_ids, responses_test, batch_size=None, shuffle=None,
+                                    image_cache=test_cache, repeat_condition=testing_image_ids)}
+
+        if build_mei_loaders:
+            entries["test_mei_uncropped"] = mkloader(mei_uncropped_ids, _f32(mei_uncropped_responses),
+                                                     batch_size=None, shuffle=None, image_cache=test_cache,
+                                                     repeat_condition=mei_uncropped_ids)
+            entries["test_mei_cropped"] = mkloader(mei_cropped_ids, _f32(mei_cropped_responses),
+                                                   batch_size=None, shuffle=None, image_cache=test_cache,
+                                                   repeat_condition=mei_cropped_ids)
+        del mei_uncropped_responses, mei_cropped_responses
+
+        if build_control_loaders:
+            entries["test_control_uncropped"] = mkloader(control_uncropped_ids, _f32(control_uncropped_responses),
+                                                         batch_size=None, shuffle=None, image_cache=test_cache,
+                                                         repeat_condition=control_uncropped_ids)
+            entries["test_control_cropped"] = mkloader(control_cropped_ids, _f32(control_cropped_responses),
+                                                       batch_size=None, shuffle=None, image_cache=test_cache,
+                                                       repeat_condition=control_cropped_ids)
+        del control_uncropped_responses, control_cropped_responses
 
         if include_mei_training or include_control_training:
-            dataloaders["validation_extended"][data_key] = val_loader_extended
+            entries["validation_extended"] = val_loader_extended
+
+        return data_key, entries, train_cache, test_cache
+
+    # sessions are independent, so their loaders are built concurrently; the
+    # dataloaders dicts are only filled in the main thread
+    n_sessions = len(neuronal_data_files)
+    session_pool = ThreadPoolExecutor(max_workers=min(8, max(n_sessions, 1)))
+    try:
+        for data_key, entries, train_cache, test_cache in session_pool.map(build_session, range(n_sessions)):
+            TrainImageCaches[data_key] = train_cache
+            TestImageCaches[data_key] = test_cache
+            for tier, loader in entries.items():
+                dataloaders[tier][data_key] = loader
+    finally:
+        session_pool.shutdown()
+        prefetch_pool.shutdown()
 
-    if store_data_info and not os.path.exists(stats_path):
+    if store_data_info and not _data_info_exists(stats_path):
 
-        in_name, out_name = next(iter(list(dataloaders["train"].values())[0]))._fields
+        in_name, out_name = next(iter(next(iter(dataloaders["train"].values()))))._fields
 
         session_shape_dict = get_dims_for_loader_dict(dataloaders["train"])
         n_neurons_dict = {k: v[out_name][1] for k, v in session_shape_dict.items()}
@@ -816,7 +1187,6 @@ def monkey_static_loader_closed_loop(dataset,
         stats_path_base = str(Path(stats_path).parent)
         if not os.path.exists(stats_path_base):
             os.mkdir(stats_path_base)
-        with open(stats_path, "wb") as pkl:
-            pickle.dump(data_info, pkl)
+        _save_data_info(data_info, stats_path)
 
     return dataloaders if not return_data_info else data_info
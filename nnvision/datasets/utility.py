@@ -72,15 +72,13 @@ def get_fraction_of_training_images(image_ids, fraction, seed=None, replace=Fals
     if len(image_ids.shape) > 1:
         raise ValueError("image_ids must be a one dimensional vector ")
 
-    if seed is not None:
-        np.random.seed(seed)
-    else:
-        np.random.seed()
-
-    n_images = len(image_ids)
-    image_indices = np.arange(n_images)
-    idx_out = np.random.choice(image_indices, int(n_images * fraction), replace=replace)
-    return idx_out
+    # draw on the unique ids with the vectorized Generator API, then map the
+    # picked ids back to positions - keeps repeated presentations of an image
+    # together and avoids reseeding the global RNG state
+    rng = np.random.default_rng(seed)
+    unique_ids = np.unique(image_ids)
+    picked_ids = rng.choice(unique_ids, size=int(len(unique_ids) * fraction), replace=replace)
+    return np.flatnonzero(np.isin(image_ids, picked_ids))
 
 
 class ImageCache:
@@ -200,6 +198,12 @@ class ImageCache:
         """
         zscore images in cache
         """
+        if self.img_mean is not None and self.img_std is not None:
+            # statistics are already known (restored from a stats file or from a
+            # previous call on this pooled cache), and images loaded under known
+            # stats are normalized on the fly - recomputing would walk the full
+            # image set again and z-score already-standardized tensors twice
+            return
         images   = self.loaded_images
         img_mean = images.mean()
         img_std  = images.std()
@@ -211,6 +215,28 @@ class ImageCache:
             self.img_mean = np.float32(img_mean.item())
             self.img_std  = np.float32(img_std.item())
         
+    def preload(self, keys, pin_memory=False):
+        """
+        warms the cache for the given image ids in a single pass, so that several
+        loaders built on top of this cache do not each fault in the same images.
+        Optionally pins the preloaded tensors in page-locked memory (no-op
+        without CUDA), enabling DMA host-to-GPU copies.
+        """
+        pin = pin_memory and torch.cuda.is_available()
+        for key in np.unique(np.asarray(keys)):
+            image = self.update(int(key))
+            if pin and not image.is_pinned():
+                self.cache[int(key)] = image.pin_memory()
+
+    def pin_cached_images(self):
+        """
+        moves all cached images into page-locked memory, so that DataLoader batches
+        can be copied to the GPU via DMA without a pageable-to-pinned staging copy.
+        No-op when CUDA is not available.
+        """
+        if torch.cuda.is_available():
+            self.cache = {key: image.pin_memory() for key, image in self.cache.items()}
+
     @property
     def image_shape(self):
         if self.cache_size > 0:
@@ -221,6 +247,29 @@ class ImageCache:
             return self.image_shape
 
 
+_image_cache_pool = {}
+
+
+def get_image_cache(path=None, subsample=1, crop=0, scale=1, img_mean=None, img_std=None,
+                    transform=True, normalize=True, filename_precision=6):
+    """
+    Returns a memoized ImageCache. Loaders that are constructed repeatedly with
+    identical cache parameters (e.g. the train/val/test variants of one dataset in
+    an nnfabrik sweep) share a single instance, so images are decoded and
+    normalized only once.
+
+    Accepts the same arguments as ImageCache.
+    """
+    stat_key = lambda stat: np.asarray(stat).tobytes() if stat is not None else None
+    key = (path, subsample, str(np.asarray(crop).tolist()), scale, stat_key(img_mean), stat_key(img_std),
+           transform, normalize, filename_precision)
+    if key not in _image_cache_pool:
+        _image_cache_pool[key] = ImageCache(path=path, subsample=subsample, crop=crop, scale=scale,
+                                            img_mean=img_mean, img_std=img_std, transform=transform,
+                                            normalize=normalize, filename_precision=filename_precision)
+    return _image_cache_pool[key]
+
+
 class CachedTensorDataset(utils.Dataset):
     """
     Dataset wrapping tensors.
@@ -261,7 +310,8 @@ class CachedTensorDataset(utils.Dataset):
         return self.tensors[0].size(0)
 
 
-def get_cached_loader(*args, batch_size=None, shuffle=True, image_cache=None, repeat_condition=None, names=('inputs', 'targets')):
+def get_cached_loader(*args, batch_size=None, shuffle=True, image_cache=None, repeat_condition=None,
+                      names=('inputs', 'targets'), num_workers=0, pin_memory=True, persistent_workers=None):
     """
 
     Args:
@@ -270,6 +320,10 @@ def get_cached_loader(*args, batch_size=None, shuffle=True, image_cache=None, re
         batch_size: int - batch size for the dataloader
         shuffle: Boolean, shuffles image in the dataloader if True
         image_cache: a cache object which stores the images
+        num_workers: int - number of DataLoader worker processes
+        pin_memory: Boolean, returns batches in page-locked memory (if CUDA is available)
+        persistent_workers: Boolean, keeps worker processes alive across epochs.
+            Defaults to True whenever num_workers > 0.
 
     Returns: a PyTorch DataLoader object
     """
@@ -283,12 +337,23 @@ def get_cached_loader(*args, batch_size=None, shuffle=True, image_cache=None, re
             names = names + ('eye_position',)
         tensors.append(eye_position)
     dataset = CachedTensorDataset(*tensors, image_cache=image_cache, names=names)
-    sampler = RepeatsBatchSampler(repeat_condition) if repeat_condition is not None else None
 
-    dataloader = utils.DataLoader(dataset, batch_sampler=sampler) if batch_size is None else utils.DataLoader(dataset,
-                                                                                                            batch_size=batch_size,
-                                                                                                            shuffle=shuffle,
-                                                                                                            )
+    if persistent_workers is None:
+        persistent_workers = num_workers > 0
+    loader_kwargs = dict(num_workers=num_workers,
+                         pin_memory=pin_memory and torch.cuda.is_available(),
+                         persistent_workers=persistent_workers and num_workers > 0)
+
+    if batch_size is None:
+        sampler = RepeatsBatchSampler(repeat_condition) if repeat_condition is not None else None
+        dataloader = utils.DataLoader(dataset, batch_sampler=sampler, **loader_kwargs)
+    else:
+        # drive the loader with whole index batches: every batch is then assembled in a
+        # single vectorized dataset lookup, which amortizes the per-sample python
+        # dispatch and collate overhead of the default sampler
+        index_sampler = utils.RandomSampler(dataset) if shuffle else utils.SequentialSampler(dataset)
+        batch_sampler = utils.BatchSampler(index_sampler, batch_size=batch_size, drop_last=False)
+        dataloader = utils.DataLoader(dataset, sampler=batch_sampler, batch_size=None, **loader_kwargs)
     return dataloader
 
 
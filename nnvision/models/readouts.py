@@ -1,3 +1,5 @@
+import weakref
+
 import torch
 
 from torch import nn
@@ -9,22 +11,97 @@ from neuralpredictors.layers.readouts import PointPooled2d, FullGaussian2d, Spat
 from neuralpredictors.layers.legacy import Gaussian2d
 
 
+_core_output_cache = weakref.WeakKeyDictionary()
+
+
+def _get_core_output_shape(core, in_shape):
+    """
+    Memoizes get_module_output per (core, input shape). Every call runs a full
+    dummy forward through the core, and multi-session models typically share a
+    handful of input shapes, so this turns O(sessions) core forwards at build
+    time into O(unique shapes). The cache holds the core itself via a weak
+    reference, so a different core never inherits stale shapes (which a plain
+    id(core) key could, once the id gets recycled) and entries die with their
+    core instead of accumulating over a sweep.
+    """
+    per_core = _core_output_cache.setdefault(core, {})
+    key = tuple(in_shape)
+    if key not in per_core:
+        per_core[key] = get_module_output(core, in_shape)[1:]
+    return per_core[key]
+
+
 class MultiReadout:
     def forward(self, *args, data_key=None, **kwargs):
         if data_key is None and len(self) == 1:
             data_key = list(self.keys())[0]
         return self[data_key](*args, **kwargs)
 
+    def forward_all(self, x_dict, **kwargs):
+        """
+        Runs the per-session readouts for a dict of {data_key: input} and returns
+        a dict of outputs. On CUDA inputs each readout is launched on its own
+        stream, overlapping the small independent kernels that a sequential loop
+        would serialize on the default stream; on CPU it falls back to a loop.
+        """
+        if not (torch.cuda.is_available() and all(x.is_cuda for x in x_dict.values())):
+            return {data_key: self[data_key](x, **kwargs) for data_key, x in x_dict.items()}
+
+        current = torch.cuda.current_stream()
+        streams = {data_key: torch.cuda.Stream() for data_key in x_dict}
+        outputs = {}
+        for data_key, x in x_dict.items():
+            streams[data_key].wait_stream(current)
+            with torch.cuda.stream(streams[data_key]):
+                outputs[data_key] = self[data_key](x, **kwargs)
+        for stream in streams.values():
+            current.wait_stream(stream)
+        return outputs
+
+    @staticmethod
+    def enable_fast_math():
+        """
+        Opts the GEMM-heavy readouts into cuDNN autotuning and, on Ampere or
+        newer GPUs (compute capability 8.0+), TF32 matmuls, where TF32 keeps
+        enough mantissa for these small readout GEMMs. Autotuning helps on any
+        GPU; the whole switch is a no-op on CPU-only builds. Affects global
+        torch backend flags, so it is an explicit switch rather than a
+        constructor side effect.
+        """
+        if not torch.cuda.is_available():
+            return
+        torch.backends.cudnn.benchmark = True
+        if torch.cuda.get_device_capability() >= (8, 0):
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.backends.cudnn.allow_tf32 = True
+
     def regularizer(self, data_key):
         return self[data_key].feature_l1(average=False) * self.gamma_readout
 
+    def total_regularizer(self):
+        """
+        Readout penalty summed over all sessions. When the subclass uses the
+        plain feature-L1 regularizer, this launches a single abs/sum kernel over
+        the concatenated features instead of one reduction (and one host sync)
+        per session; subclasses with a custom per-key regularizer (e.g. the
+        spatial x feature penalty or the grid dispersion term) fall back to
+        summing regularizer(k) over the data keys, as do readouts with shared
+        features, where feature_l1 counts the shared tensor only once but a
+        concat over sessions would penalize it once per session.
+        """
+        if type(self).regularizer is not MultiReadout.regularizer or \
+                not all(getattr(self[data_key], "_original_features", True) for data_key in self.keys()):
+            return sum(self.regularizer(data_key) for data_key in self.keys())
+        features = torch.cat([self[data_key].features.reshape(-1) for data_key in self.keys()])
+        return features.abs().sum() * self.gamma_readout
+
 
 class MultiplePointPooled2d(MultiReadout, torch.nn.ModuleDict):
     def __init__(self, core, in_shape_dict, n_neurons_dict, pool_steps, pool_kern, bias, init_range, gamma_readout):
         # super init to get the _module attribute
         super().__init__()
         for k in n_neurons_dict:
-            in_shape = get_module_output(core, in_shape_dict[k])[1:]
+            in_shape = _get_core_output_shape(core, in_shape_dict[k])
             n_neurons = n_neurons_dict[k]
             self.add_module(
                 k,
@@ -41,7 +118,7 @@ class MultipleGaussian2d(torch.nn.ModuleDict):
         # super init to get the _module attribute
         super().__init__()
         for k in n_neurons_dict:
-            in_shape = get_module_output(core, in_shape_dict[k])[1:]
+            in_shape = _get_core_output_shape(core, in_shape_dict[k])
             n_neurons = n_neurons_dict[k]
             self.add_module(k, Gaussian2d(
                 in_shape=in_shape,
@@ -66,7 +143,7 @@ class MultipleSpatialXFeatureLinear(MultiReadout, torch.nn.ModuleDict):
         # super init to get the _module attribute
         super().__init__()
         for k in n_neurons_dict:
-            in_shape = get_module_output(core, in_shape_dict[k])[1:]
+            in_shape = _get_core_output_shape(core, in_shape_dict[k])
             n_neurons = n_neurons_dict[k]
             self.add_module(k, SpatialXFeatureLinear(
                 in_shape=in_shape,
@@ -92,7 +169,7 @@ class MultipleFullGaussian2d(MultiReadout, torch.nn.ModuleDict):
         k0 = None
         for i, k in enumerate(n_neurons_dict):
             k0 = k0 or k
-            in_shape = get_module_output(core, in_shape_dict[k])[1:]
+            in_shape = _get_core_output_shape(core, in_shape_dict[k])
             n_neurons = n_neurons_dict[k]
 
             source_grid = None
@@ -150,7 +227,7 @@ class MultipleRemappedGaussian2d(MultiReadout, torch.nn.ModuleDict):
         k0 = None
         for i, k in enumerate(n_neurons_dict):
             k0 = k0 or k
-            in_shape = get_module_output(core, in_shape_dict[k])[1:]
+            in_shape = _get_core_output_shape(core, in_shape_dict[k])
             n_neurons = n_neurons_dict[k]
 
             source_grid = None
@@ -211,7 +288,7 @@ class MultipleAttention2d(MultiReadout, torch.nn.ModuleDict):
         k0 = None
         for i, k in enumerate(n_neurons_dict):
             k0 = k0 or k
-            in_shape = get_module_output(core, in_shape_dict[k])[1:]
+            in_shape = _get_core_output_shape(core, in_shape_dict[k])
             n_neurons = n_neurons_dict[k]
 
             self.add_module(
@@ -238,8 +315,9 @@ class DenseReadout(nn.Module):
         self.outdims = outdims
         self.init_noise = init_noise
         c, w, h = in_shape
+        self._flat_dim = c * w * h
 
-        self.linear = torch.nn.Linear(in_features=c*w*h,
+        self.linear = torch.nn.Linear(in_features=self._flat_dim,
                                       out_features=outdims,
                                       bias=False)
         if bias:
@@ -255,23 +333,18 @@ class DenseReadout(nn.Module):
         return next(iter(self.linear.parameters()))
 
     def feature_l1(self, average=False):
-        if average:
-            return self.features.abs().mean()
-        else:
-            return self.features.abs().sum()
+        return self.features.abs().mean() if average else self.features.abs().sum()
 
     def initialize(self):
         self.features.data.normal_(0, self.init_noise)
 
     def forward(self, x):
-
-        b, c, w, h = x.shape
-
-        x = x.view(b, c * w * h)
-        y = self.linear(x)
+        x = x.reshape(x.size(0), self._flat_dim)
         if self.bias is not None:
-            y = y + self.bias
-        return y
+            # fold the bias add into the GEMM epilogue instead of launching a
+            # separate elementwise kernel after the linear
+            return torch.addmm(self.bias, x, self.linear.weight.t())
+        return self.linear(x)
 
     def __repr__(self):
         return self.__class__.__name__ + \
@@ -294,7 +367,7 @@ class MultipleDense(MultiReadout, torch.nn.ModuleDict):
         k0 = None
         for i, k in enumerate(n_neurons_dict):
             k0 = k0 or k
-            in_shape = get_module_output(core, in_shape_dict[k])[1:]
+            in_shape = _get_core_output_shape(core, in_shape_dict[k])
             n_neurons = n_neurons_dict[k]
 
             self.add_module(
@@ -306,4 +379,32 @@ class MultipleDense(MultiReadout, torch.nn.ModuleDict):
                     init_noise=init_noise,
                 ),
             )
-        self.gamma_readout = gamma_readout
\ No newline at end of file
+        self.gamma_readout = gamma_readout
+        # sessions can only be fused into one GEMM when they see the same core output
+        self._same_in_shape = len({self[k].in_shape for k in self.keys()}) == 1
+
+    def forward_batched(self, x):
+        """
+        Evaluates all session readouts on one shared input and returns a
+        {data_key: output} dict. When every session has the same input shape,
+        the per-session weights are concatenated along the output dimension and
+        applied in a single GEMM instead of one small matmul per session; the
+        result is then sliced per session and the biases added.
+        """
+        if not self._same_in_shape:
+            return {data_key: self[data_key](x) for data_key in self.keys()}
+
+        flat = x.reshape(x.size(0), -1)
+        weight = torch.cat([self[data_key].features for data_key in self.keys()], dim=0)
+        joint = flat @ weight.t()
+
+        outputs = {}
+        offset = 0
+        for data_key in self.keys():
+            readout = self[data_key]
+            y = joint[:, offset:offset + readout.outdims]
+            if readout.bias is not None:
+                y = y + readout.bias
+            outputs[data_key] = y
+            offset += readout.outdims
+        return outputs
\ No newline at end of file
@@ -1,4 +1,5 @@
 import datajoint as dj
+from collections import OrderedDict
 from functools import reduce
 
 from nnfabrik.utility.nnf_helper import FabrikCache
@@ -7,10 +8,36 @@ from .from_nnfabrik import TrainedModel, TrainedTransferModel
 from .from_mei import Ensemble
 
 
-DataCache = FabrikCache(base_table=Dataset, cache_size_limit=1)
-TrainedModelCache = FabrikCache(base_table=TrainedModel, cache_size_limit=1)
-TransferTrainedModelCache = FabrikCache(base_table=TrainedTransferModel, cache_size_limit=1)
-EnsembleModelCache = FabrikCache(base_table=Ensemble, cache_size_limit=1)
+class LRUFabrikCache(FabrikCache):
+    """
+    FabrikCache with least-recently-used eviction. The base class evicts in
+    insertion order, so alternating between a few recurring keys with a small
+    limit keeps rebuilding entries that were just used; backing the cache with
+    an OrderedDict and refreshing entries on access makes repeated lookups of
+    recurring keys hit the cache after the first fetch.
+    """
+
+    def __init__(self, base_table, cache_size_limit=10):
+        super().__init__(base_table=base_table, cache_size_limit=cache_size_limit)
+        self.cache = OrderedDict()
+
+    def _cache_model(self, key, **kwargs):
+        self.cache[self._hash_trained_model_key(key)] = self._load_model(key, **kwargs)
+        while len(self.cache) > self.cache_size_limit:
+            self.cache.popitem(last=False)
+
+    def _get_cached_model(self, key):
+        hashed_key = self._hash_trained_model_key(key)
+        self.cache.move_to_end(hashed_key)
+        return self.cache[hashed_key]
+
+
+# dataloaders are comparatively cheap to hold, models much less so - hence the
+# smaller limit on the model caches
+DataCache = LRUFabrikCache(base_table=Dataset, cache_size_limit=32)
+TrainedModelCache = LRUFabrikCache(base_table=TrainedModel, cache_size_limit=4)
+TransferTrainedModelCache = LRUFabrikCache(base_table=TrainedTransferModel, cache_size_limit=4)
+EnsembleModelCache = LRUFabrikCache(base_table=Ensemble, cache_size_limit=4)
 
 
 def rename_table_attributes(tables, attrib, attrib_names, unit_table=False):
@@ -22,4 +49,4 @@ def rename_table_attributes(tables, attrib, attrib_names, unit_table=False):
                        for i, table in enumerate(tables)]
 
     joined_table = reduce(lambda x, y: x*y, proj_tables)
-    return joined_table
\ No newline at end of file
+    return joined_table